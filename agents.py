@@ -0,0 +1,114 @@
+"""Packed-array simulation of many path-following runners.
+
+Paths are kept in their run-length encoded ``CompactPath`` form and shared
+by reference. Agents that follow the same path and started on the same
+tick always stand on the same cell, so they are stored as one cohort slot
+(path id, length, spawn tick, head count) in packed arrays. All agents
+advance on a shared fixed-timestep clock, so ``update`` is O(1), and a
+frame resolves one cell per cohort, at most one per path step, however
+many agents there are.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from compact_path import CompactPath
+
+Pos = Tuple[int, int]
+
+
+class AgentPool:
+    def __init__(self, speed: float):
+        self.step_time = 1.0 / speed
+        self.tick = 0
+        self._accum = 0.0
+        self._count = 0
+
+        # Shared paths; cohorts refer to them by index.
+        self._paths: List[CompactPath] = []
+
+        # One slot per cohort.
+        self.path_id = array("i")
+        self.length = array("i")
+        self.spawn_tick = array("q")
+        self.count = array("i")
+        self._slots: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        """Number of agents (not cohorts)."""
+        return self._count
+
+    def clear(self) -> None:
+        """Remove all agents and stored paths."""
+        for arr in (self.path_id, self.length, self.spawn_tick, self.count):
+            del arr[:]
+        self._slots.clear()
+        self._paths.clear()
+        self._count = 0
+        self.tick = 0
+        self._accum = 0.0
+
+    def add_path(self, path: Iterable[Pos]) -> int:
+        """Store ``path`` for playback and return its handle.
+
+        A ``CompactPath`` is kept by reference; plain cell lists are encoded
+        first (without a grid, so that copy's ``cost`` is None).
+        """
+        if not isinstance(path, CompactPath):
+            path = CompactPath.from_positions(list(path))
+        self._paths.append(path)
+        return len(self._paths) - 1
+
+    def _add(self, handle: int, spawn_tick: int, count: int) -> None:
+        key = (handle, spawn_tick)
+        slot = self._slots.get(key)
+        if slot is None:
+            self._slots[key] = len(self.path_id)
+            self.path_id.append(handle)
+            self.length.append(len(self._paths[handle]))
+            self.spawn_tick.append(spawn_tick)
+            self.count.append(count)
+        else:
+            self.count[slot] += count
+        self._count += count
+
+    def spawn(self, handle: int, delay_steps: int = 0) -> bool:
+        if len(self._paths[handle]) == 0:
+            return False
+        self._add(handle, self.tick + delay_steps, 1)
+        return True
+
+    def spawn_many(self, handle: int, count: int, spread: int = 1) -> None:
+        """Add ``count`` agents on one path, start times staggered over ``spread`` steps."""
+        if len(self._paths[handle]) == 0 or count <= 0:
+            return
+        spread = max(1, min(spread, count))
+        per_tick, extra = divmod(count, spread)
+        for i in range(spread):
+            self._add(handle, self.tick + i, per_tick + (1 if i < extra else 0))
+
+    def update(self, dt: float) -> None:
+        """Advance the shared clock by whole fixed timesteps."""
+        self._accum += dt
+        if self._accum >= self.step_time:
+            steps = int(self._accum / self.step_time)
+            self.tick += steps
+            self._accum -= steps * self.step_time
+
+    def positions(self) -> List[Pos]:
+        """One entry per occupied cell, no matter how many agents stand on it."""
+        paths = self._paths
+        tick = self.tick
+        seen: Dict[Tuple[int, int], None] = {}
+        cells: Dict[Pos, None] = {}
+        for pid, ln, st in zip(self.path_id, self.length, self.spawn_tick):
+            # Step k shows cell k - 1; before the first step the agent sits on the start.
+            key = (pid, min(max(tick - st, 1), ln) - 1)
+            if key not in seen:
+                seen[key] = None
+                cells[paths[pid].cell_at(key[1])] = None
+        return list(cells)
+
+    def screen_positions(self, origin_x: int, origin_y: int, cell_size: int) -> List[Pos]:
+        """Top-left pixel of every occupied cell, ready for ``Surface.blits``."""
+        return [(origin_x + x * cell_size, origin_y + y * cell_size) for x, y in self.positions()]
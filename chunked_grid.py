@@ -0,0 +1,172 @@
+"""Disk-backed grid split into fixed-size square chunks.
+
+``ChunkedGrid`` looks like the nested-list grid the editor works on:
+``len(grid)``, ``len(grid[0])`` and ``grid[y][x]`` all work, so
+``path_finding.neighbors`` and ``step_cost`` run on it unchanged. Only the
+chunks touched by a search are kept in memory, in an LRU page cache.
+"""
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+
+META_FILE = "meta.json"
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MAX_CHUNKS = 64
+
+
+class _Row:
+    """View of one grid row, returned by ``ChunkedGrid[y]``."""
+
+    __slots__ = ("_grid", "_y")
+
+    def __init__(self, grid: "ChunkedGrid", y: int):
+        self._grid = grid
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._grid.cols
+
+    def __getitem__(self, x: int) -> int:
+        if not 0 <= x < self._grid.cols:
+            raise IndexError(x)
+        return self._grid.get(x, self._y)
+
+    def __setitem__(self, x: int, value: int) -> None:
+        if not 0 <= x < self._grid.cols:
+            raise IndexError(x)
+        self._grid.set(x, self._y, value)
+
+
+class ChunkedGrid:
+    """Grid of byte-sized tiles stored as ``chunk_<cx>_<cy>.bin`` files."""
+
+    def __init__(self, directory, max_chunks: int = DEFAULT_MAX_CHUNKS):
+        if max_chunks < 1:
+            raise ValueError(f"max_chunks must be at least 1, got {max_chunks}")
+        self.directory = Path(directory)
+        meta = json.loads((self.directory / META_FILE).read_text(encoding="utf-8"))
+        self.cols: int = meta["cols"]
+        self.rows: int = meta["rows"]
+        self.chunk_size: int = meta["chunk_size"]
+        self.max_chunks = max_chunks
+
+        self._pages: "OrderedDict[Tuple[int, int], bytearray]" = OrderedDict()
+        self._dirty: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # --- construction ---------------------------------------------------
+
+    @staticmethod
+    def _write_meta(directory: Path, cols: int, rows: int, chunk_size: int, max_chunks: int) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if max_chunks < 1:
+            raise ValueError(f"max_chunks must be at least 1, got {max_chunks}")
+        directory.mkdir(parents=True, exist_ok=True)
+        meta = {"cols": cols, "rows": rows, "chunk_size": chunk_size}
+        (directory / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def create(cls, directory, cols: int, rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+               fill: int = 0, max_chunks: int = DEFAULT_MAX_CHUNKS) -> "ChunkedGrid":
+        """Write an empty map of ``cols`` x ``rows`` tiles without building it in RAM."""
+        directory = Path(directory)
+        cls._write_meta(directory, cols, rows, chunk_size, max_chunks)
+
+        blank = bytes([fill]) * (chunk_size * chunk_size)
+        for cy in range((rows + chunk_size - 1) // chunk_size):
+            for cx in range((cols + chunk_size - 1) // chunk_size):
+                (directory / f"chunk_{cx}_{cy}.bin").write_bytes(blank)
+        return cls(directory, max_chunks=max_chunks)
+
+    @classmethod
+    def from_rows(cls, directory, rows: Sequence[Sequence[int]], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  max_chunks: int = DEFAULT_MAX_CHUNKS) -> "ChunkedGrid":
+        """Convert a nested-list grid (e.g. ``StageData.mutable_grid()``) to chunk files.
+
+        Each chunk is assembled from row slices and written once, bypassing
+        the page cache.
+        """
+        directory = Path(directory)
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        cls._write_meta(directory, width, height, chunk_size, max_chunks)
+
+        size = chunk_size
+        for cy in range((height + size - 1) // size):
+            for cx in range((width + size - 1) // size):
+                chunk = bytearray(size * size)
+                x0 = cx * size
+                for r, y in enumerate(range(cy * size, min((cy + 1) * size, height))):
+                    seg = rows[y][x0:x0 + size]
+                    chunk[r * size:r * size + len(seg)] = bytes(seg)
+                (directory / f"chunk_{cx}_{cy}.bin").write_bytes(chunk)
+        return cls(directory, max_chunks=max_chunks)
+
+    # --- paging -----------------------------------------------------------
+
+    def _chunk_path(self, key: Tuple[int, int]) -> Path:
+        return self.directory / f"chunk_{key[0]}_{key[1]}.bin"
+
+    def _page(self, key: Tuple[int, int]) -> bytearray:
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+        self.misses += 1
+        page = bytearray(self._chunk_path(key).read_bytes())
+        self._pages[key] = page
+        while len(self._pages) > self.max_chunks:
+            old_key, old_page = self._pages.popitem(last=False)
+            if old_key in self._dirty:
+                self._chunk_path(old_key).write_bytes(old_page)
+                self._dirty.discard(old_key)
+            self.evictions += 1
+        return page
+
+    def flush(self) -> None:
+        """Write modified chunks that are still cached back to disk."""
+        for key in list(self._dirty):
+            self._chunk_path(key).write_bytes(self._pages[key])
+        self._dirty.clear()
+
+    # --- cell access ------------------------------------------------------
+
+    def get(self, x: int, y: int) -> int:
+        size = self.chunk_size
+        page = self._page((x // size, y // size))
+        return page[(y % size) * size + (x % size)]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        size = self.chunk_size
+        key = (x // size, y // size)
+        page = self._page(key)
+        page[(y % size) * size + (x % size)] = value
+        self._dirty.add(key)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, y: int) -> _Row:
+        if not 0 <= y < self.rows:
+            raise IndexError(y)
+        return _Row(self, y)
+
+    def __iter__(self) -> Iterable[_Row]:
+        for y in range(self.rows):
+            yield _Row(self, y)
+
+    def cache_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident": len(self._pages),
+            "max_chunks": self.max_chunks,
+        }
@@ -0,0 +1,112 @@
+"""Run-length encoded grid paths.
+
+A ``CompactPath`` keeps the start cell plus one (direction, run) pair per
+straight segment instead of a tuple per cell. Length and cost are stored,
+the turn points are precomputed for drawing, and cells are produced lazily
+when iterated.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from path_finding import Grid, Pos, step_cost
+
+# Direction codes used in the run-length stream.
+DIRS: Tuple[Pos, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIR_CODE = {d: i for i, d in enumerate(DIRS)}
+
+
+class CompactPath:
+    __slots__ = ("start", "_dirs", "_runs", "_ends", "corners", "length", "cost")
+
+    def __init__(self, start: Optional[Pos], dirs: bytes, runs: Sequence[int], cost: Optional[int] = None):
+        self.start = start
+        self._dirs = bytes(dirs)
+        self._runs = array("I", runs)
+        # Cumulative step count at the end of each run, for cell_at().
+        self._ends = array("I")
+        total = 0
+        for run in self._runs:
+            total += run
+            self._ends.append(total)
+
+        self.length = 0 if start is None else total + 1
+        # None when encoded without a grid: the cost is unknown, not zero.
+        self.cost = 0 if start is None else cost
+        self.corners: Tuple[Pos, ...] = tuple(self._corner_cells())
+
+    @classmethod
+    def empty(cls) -> "CompactPath":
+        return cls(None, b"", ())
+
+    @classmethod
+    def from_positions(cls, path: Sequence[Pos], grid: Optional[Grid] = None) -> "CompactPath":
+        """Encode a cell list (as returned by ``reconstruct``).
+
+        With ``grid`` the path cost is computed in the same pass; without
+        it ``cost`` is None.
+        """
+        if not path:
+            return cls.empty()
+
+        dirs = bytearray()
+        runs: List[int] = []
+        cost = 0 if grid is not None else None
+        prev = path[0]
+        for cur in path[1:]:
+            code = _DIR_CODE.get((cur[0] - prev[0], cur[1] - prev[1]))
+            if code is None:
+                raise ValueError(f"Path is not 4-connected at {prev} -> {cur}")
+            if dirs and dirs[-1] == code:
+                runs[-1] += 1
+            else:
+                dirs.append(code)
+                runs.append(1)
+            if grid is not None:
+                cost += step_cost(grid, cur)
+            prev = cur
+        return cls(tuple(path[0]), dirs, runs, cost)
+
+    def _corner_cells(self) -> Iterator[Pos]:
+        if self.start is None:
+            return
+        x, y = self.start
+        yield x, y
+        for code, run in zip(self._dirs, self._runs):
+            dx, dy = DIRS[code]
+            x, y = x + dx * run, y + dy * run
+            yield x, y
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
+
+    def __iter__(self) -> Iterator[Pos]:
+        if self.start is None:
+            return
+        x, y = self.start
+        yield x, y
+        for code, run in zip(self._dirs, self._runs):
+            dx, dy = DIRS[code]
+            for _ in range(run):
+                x, y = x + dx, y + dy
+                yield x, y
+
+    def cell_at(self, k: int) -> Pos:
+        """Cell after ``k`` steps, in O(log runs)."""
+        if not 0 <= k < self.length:
+            raise IndexError(k)
+        if k == 0:
+            return self.start
+        i = bisect_right(self._ends, k - 1)
+        done = self._ends[i - 1] if i else 0
+        cx, cy = self.corners[i]
+        dx, dy = DIRS[self._dirs[i]]
+        return cx + dx * (k - done), cy + dy * (k - done)
+
+    def runs(self) -> Iterator[Tuple[Pos, int]]:
+        """(direction, steps) for each straight segment."""
+        return ((DIRS[code], run) for code, run in zip(self._dirs, self._runs))
@@ -58,78 +58,99 @@ def build_rows(history: List[Dict[str, Any]], method_order: Sequence[str]) -> Li
     return rows
 
 
-def draw_table(
-    screen,
-    font,
-    history: List[Dict[str, Any]],
-    method_order: Sequence[str],
-    width: int,
-    height: int,
-    text_color,
-    grid_color,
-):
-    """Render the evaluation table at the top-right with grid lines."""
-    rows = build_rows(history, method_order)
+# Column layout shared by the panel builder: (header label, width).
+TABLE_COLS = [
+    ("No", 36),
+    ("Al", 40),
+    ("S", 26),
+    ("Ln", 36),
+    ("Ct", 36),
+    ("Time", 72),
+    ("N", 56),
+]
+ROW_KEYS = ("no", "algo", "stage", "len", "cost", "time", "nodes")
+
+# Last pre-rendered panel. Rebuilt only when the caller hands in a different
+# history list (record_evaluation/clear_results always replace it) or the
+# layout inputs change.
+_panel_cache: Dict[str, Any] = {"history": None, "key": None, "surface": None}
+
+
+def _build_panel(font, rows, text_color, grid_color, text_cache=None):
+    """Render the whole table once onto an alpha surface."""
+    render = text_cache.render if text_cache is not None else (
+        lambda txt, color: font.render(txt, True, color)
+    )
 
     title = "Evaluasi tiap Methd"
-    cols = [
-        ("No", 36),
-        ("Al", 40),
-        ("S", 26),
-        ("Ln", 36),
-        ("Ct", 36),
-        ("Time", 72),
-        ("N", 56),
-    ]
-
     pad = 10
     row_h = 22
-    table_w = sum(width for _, width in cols) + pad * 2
+    table_w = sum(w for _, w in TABLE_COLS) + pad * 2
     table_h = pad + row_h * (2 + max(len(rows), 1)) + pad  # title + header + rows
 
-    table_x = width - table_w - 16
-    table_y = 12
-
-    panel_rect = pygame.Rect(table_x - 6, table_y - 6, table_w + 12, table_h + 12)
-    pygame.draw.rect(screen, PANEL_BG, panel_rect, border_radius=8)
+    # Local coordinates: the table starts 6px inside the panel border.
+    table_x = table_y = 6
+    panel = pygame.Surface((table_w + 12, table_h + 12), pygame.SRCALPHA)
+    pygame.draw.rect(panel, PANEL_BG, panel.get_rect(), border_radius=8)
 
     cursor_y = table_y + pad
-    title_surf = font.render(title, True, text_color)
-    screen.blit(title_surf, (table_x + pad, cursor_y))
+    panel.blit(render(title, text_color), (table_x + pad, cursor_y))
     cursor_y += row_h
 
     header_y = cursor_y
-    grid_top = header_y
     grid_bottom = table_y + table_h - pad
 
-    pygame.draw.line(screen, grid_color, (table_x, header_y), (table_x + table_w, header_y), 1)
+    pygame.draw.line(panel, grid_color, (table_x, header_y), (table_x + table_w, header_y), 1)
 
     x = table_x
-    for _, width in cols:
-        pygame.draw.line(screen, grid_color, (x, header_y), (x, grid_bottom), 1)
-        x += width
-    pygame.draw.line(screen, grid_color, (table_x + table_w, header_y), (table_x + table_w, grid_bottom), 1)
+    for _, w in TABLE_COLS:
+        pygame.draw.line(panel, grid_color, (x, header_y), (x, grid_bottom), 1)
+        x += w
+    pygame.draw.line(panel, grid_color, (table_x + table_w, header_y), (table_x + table_w, grid_bottom), 1)
 
     # Header labels
     col_x = table_x + pad
-    for col_title, width in cols:
-        surf = font.render(col_title, True, text_color)
-        screen.blit(surf, (col_x, header_y + 2))
-        col_x += width
+    for col_title, w in TABLE_COLS:
+        panel.blit(render(col_title, text_color), (col_x, header_y + 2))
+        col_x += w
 
     cursor_y = header_y + row_h
-    if rows:
-        for row in rows:
-            col_x = table_x + pad
-            for (key, width) in zip(("no", "algo", "stage", "len", "cost", "time", "nodes"), [w for _, w in cols]):
-                txt = str(row.get(key, ""))
-                surf = font.render(txt, True, text_color)
-                screen.blit(surf, (col_x, cursor_y + 2))
-                col_x += width
-            cursor_y += row_h
+    for row in rows:
+        col_x = table_x + pad
+        for key, (_, w) in zip(ROW_KEYS, TABLE_COLS):
+            panel.blit(render(str(row.get(key, "")), text_color), (col_x, cursor_y + 2))
+            col_x += w
+        cursor_y += row_h
 
     # Horizontal lines for rows
     y_line = header_y + row_h
     for _ in rows[:-1]:
-        pygame.draw.line(screen, grid_color, (table_x, y_line), (table_x + table_w, y_line), 1)
+        pygame.draw.line(panel, grid_color, (table_x, y_line), (table_x + table_w, y_line), 1)
         y_line += row_h
+
+    return panel
+
+
+def draw_table(
+    screen,
+    font,
+    history: List[Dict[str, Any]],
+    method_order: Sequence[str],
+    width: int,
+    height: int,
+    text_color,
+    grid_color,
+    text_cache=None,
+):
+    """Blit the evaluation table at the top-right with grid lines.
+
+    The panel is pre-rendered and reused until ``history`` is replaced.
+    """
+    key = (tuple(method_order), tuple(text_color), tuple(grid_color), id(font))
+    panel = _panel_cache["surface"]
+    if panel is None or _panel_cache["history"] is not history or _panel_cache["key"] != key:
+        rows = build_rows(history, method_order)
+        panel = _build_panel(font, rows, text_color, grid_color, text_cache)
+        _panel_cache.update(history=history, key=key, surface=panel)
+
+    screen.blit(panel, (width - panel.get_width() - 10, 6))
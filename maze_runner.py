@@ -1,8 +1,15 @@
+import os
+
 import pygame
 import json
 
+from agents import AgentPool
+from compact_path import CompactPath
 from evaluation_table import clear_results, draw_table, load_results, save_results
-from path_finding import astar, bfs, compute_path_cost, ucs
+from path_finding import AraStar, astar, bfs, ucs
+from stage_cache import StageCache
+from text_cache import TextCache
+from workload import WorkloadRecorder
 
 WIDTH, HEIGHT = 1550, 900
 GRID_COLS, GRID_ROWS = 30, 22
@@ -13,6 +20,8 @@ MARGIN_Y = (HEIGHT - GRID_ROWS * CELL_SIZE) // 2
 
 FPS = 60
 NPC_SPEED = 8
+STRESS_AGENTS = 1000  # runners added per M press
+ARA_DEADLINE_MS = 5.0  # latency budget per frame for the anytime search
 
 BG = (15, 16, 20)
 GRID_LINE = (35, 38, 44)
@@ -20,6 +29,9 @@ WALL = (70, 74, 82)
 START_C = (80, 200, 120)
 GOAL_C = (220, 90, 90)
 PATH_RGBA = (80, 220, 120, 128)
+# Line drawn on the same layer as the tiles: the alpha of two stacked
+# PATH_RGBA layers, so it looks as if it were blended over them.
+PATH_LINE_RGBA = (80, 220, 120, 192)
 EXPLORED_C = (90, 130, 220, 80)
 NPC_C = (240, 240, 240)
 TEXT_C = (220, 220, 220)
@@ -43,79 +55,105 @@ def save_level(grid, start, goal, filename="level.json"):
         json.dump(data, f)
     print("Saved:", filename)
 
-def load_level(filename="level.json"):
-    with open(filename, "r") as f:
-        data = json.load(f)
-    return data["grid"], tuple(data["start"]), tuple(data["goal"])
 
 STAGE_FILES = ["stage1.json", "stage2.json", "stage3.json"]
 current_stage = 0
 
+# Parsed in the background at startup; refreshed only after CTRL+S.
+stage_cache = StageCache(STAGE_FILES)
+stage_cache.warm()
+
 LOCK_WALLS = False
-METHOD_ORDER = ["BFS", "UCS", "A*"]
+METHOD_ORDER = ["BFS", "UCS", "A*", "ARA*"]
+
+# Set MAZE_TRACE=session.jsonl to record edits/searches for workload.py replay.
+TRACE_FILE = os.environ.get("MAZE_TRACE")
+recorder = WorkloadRecorder(TRACE_FILE) if TRACE_FILE else None
 
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Maze Runner AI - BFS vs UCS vs A*")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("consolas", 18)
+text_cache = TextCache(font)
 
-# Prebuilt alpha surfaces for path rendering (50% opacity).
-PATH_TILE_SURF = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-PATH_TILE_SURF.fill(PATH_RGBA)
-
+# Pre-rendered path overlay (tiles + line), redrawn only when the path changes.
 PATH_LINE_SURF = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
 
-# Pre-made alpha surfaces for path visualization.
-PATH_TILE_SURF = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-PATH_TILE_SURF.fill(PATH_RGBA)
-PATH_LINE_SURF = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+# One sprite shared by every runner so they can be drawn with a single blits().
+NPC_SURF = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+pygame.draw.rect(NPC_SURF, NPC_C, NPC_SURF.get_rect(), border_radius=6)
 
 grid = [[0 for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
 start = (2, 2)
 goal = (GRID_COLS-3, GRID_ROWS-3)
 
-path = []
+path = CompactPath.empty()
+path_line_for = None  # path currently drawn on PATH_LINE_SURF
 explored = set()
 last_algo = "-"
 last_time_ms = 0.0
 last_cost = 0
+last_bound = None
+ara_search = None  # ARA* still being refined, one budget slice per frame
 evaluation_history = load_results()
 
 mode = "wall"
 
-npc_path_index = 0
-npc_tick_accum = 0.0
-npc_pos = start
+agents = AgentPool(NPC_SPEED)
+path_handle = None  # agent-pool handle of the current path
 mouse_down = False
 paint_value = None
 
+def clear_agents():
+    global path_handle
+    agents.clear()
+    path_handle = None
+
+
+def current_path_handle():
+    """Agent-pool handle for the current path, stored at most once per path."""
+    global path_handle
+    if path_handle is None:
+        path_handle = agents.add_path(path)
+    return path_handle
+
+
 def load_stage(index):
-    global grid, start, goal, current_stage
-    global path, explored, npc_pos, npc_path_index, npc_tick_accum, last_algo, last_time_ms, last_cost
+    global grid, start, goal, current_stage, ara_search
+    global path, explored, last_algo, last_time_ms, last_cost, last_bound
 
     current_stage = index
 
-    try:
-        grid_loaded, s_loaded, g_loaded = load_level(STAGE_FILES[index])
-        grid = grid_loaded
-        start = tuple(s_loaded)
-        goal = tuple(g_loaded)
+    stage = stage_cache.get(STAGE_FILES[index])
+    if stage is not None:
+        grid = stage.mutable_grid()
+        start = stage.start
+        goal = stage.goal
         print(f"Loaded {STAGE_FILES[index]}")
-    except FileNotFoundError:
-        print(f"{STAGE_FILES[index]} belum ada, pakai grid kosong dulu.")
+        if not stage.reachable(start, goal):
+            print(f"{STAGE_FILES[index]}: goal tidak terjangkau dari start.")
+    else:
+        err = stage_cache.error(STAGE_FILES[index])
+        if isinstance(err, FileNotFoundError):
+            print(f"{STAGE_FILES[index]} belum ada, pakai grid kosong dulu.")
+        else:
+            print(f"Gagal membaca {STAGE_FILES[index]}: {err}")
         grid = [[0 for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
         start = (2, 2)
         goal = (GRID_COLS-3, GRID_ROWS-3)
 
-    path.clear()
+    if recorder:
+        recorder.load(index, grid, start, goal)
+
+    path = CompactPath.empty()
     explored.clear()
-    npc_pos = start
-    npc_path_index = 0
-    npc_tick_accum = 0.0
+    clear_agents()
+    ara_search = None
     last_algo = "-"
     last_time_ms = 0.0
     last_cost = 0
+    last_bound = None
 
 
 
@@ -123,6 +161,8 @@ def grid_to_screen(x, y):
     return (MARGIN_X + x * CELL_SIZE, MARGIN_Y + y * CELL_SIZE)
 
 def draw():
+    global path_line_for
+
     screen.fill(BG)
 
     sidebar_w = max(220, MARGIN_X - 20)
@@ -165,21 +205,30 @@ def draw():
                 screen.blit(explored_surf, rect.topleft)
 
 
-    # Path overlay (green with alpha)
-    for (px, py) in path:
-        screen.blit(PATH_TILE_SURF, grid_to_screen(px, py))
-
-    # Optional: draw a "line" connecting the path nodes (also with alpha)
-    if len(path) >= 2:
-        PATH_LINE_SURF.fill((0, 0, 0, 0))
-        pts = [
-            (
-                MARGIN_X + px * CELL_SIZE + CELL_SIZE // 2,
-                MARGIN_Y + py * CELL_SIZE + CELL_SIZE // 2,
-            )
-            for (px, py) in path
-        ]
-        pygame.draw.lines(PATH_LINE_SURF, PATH_RGBA, False, pts, 4)
+    # Path overlay (green with alpha). Tiles and the connecting line are drawn
+    # onto PATH_LINE_SURF only when a new path replaces the old one; every
+    # other frame is a single blit.
+    if path:
+        if path_line_for is not path:
+            PATH_LINE_SURF.fill((0, 0, 0, 0))
+            corners = path.corners
+            # One filled rect per straight run instead of one per cell.
+            for (ax, ay), (bx, by) in zip(corners, corners[1:] or corners):
+                x0, y0 = grid_to_screen(min(ax, bx), min(ay, by))
+                w = (abs(bx - ax) + 1) * CELL_SIZE
+                h = (abs(by - ay) + 1) * CELL_SIZE
+                PATH_LINE_SURF.fill(PATH_RGBA, pygame.Rect(x0, y0, w, h))
+
+            if len(corners) >= 2:
+                pts = [
+                    (
+                        MARGIN_X + px * CELL_SIZE + CELL_SIZE // 2,
+                        MARGIN_Y + py * CELL_SIZE + CELL_SIZE // 2,
+                    )
+                    for (px, py) in corners
+                ]
+                pygame.draw.lines(PATH_LINE_SURF, PATH_LINE_RGBA, False, pts, 4)
+            path_line_for = path
         screen.blit(PATH_LINE_SURF, (0, 0))
 
     sx, sy = start
@@ -187,9 +236,10 @@ def draw():
     pygame.draw.rect(screen, START_C, pygame.Rect(*grid_to_screen(sx, sy), CELL_SIZE, CELL_SIZE))
     pygame.draw.rect(screen, GOAL_C, pygame.Rect(*grid_to_screen(gx, gy), CELL_SIZE, CELL_SIZE))
 
-    nx, ny = npc_pos
-    npc_rect = pygame.Rect(*grid_to_screen(nx, ny), CELL_SIZE, CELL_SIZE)
-    pygame.draw.rect(screen, NPC_C, npc_rect, border_radius=6)
+    if len(agents):
+        screen.blits([(NPC_SURF, p) for p in agents.screen_positions(MARGIN_X, MARGIN_Y, CELL_SIZE)], False)
+    else:
+        screen.blit(NPC_SURF, grid_to_screen(sx, sy))
 
     info_lines = [
         f"Stage: {current_stage+1} (F1/F2/F3, TAB next)",
@@ -203,6 +253,8 @@ def draw():
         f"",
         f"Run:",
         f"1 = BFS | 2 = UCS | 3 = A*",
+        f"4 = ARA* ({ARA_DEADLINE_MS:g} ms budget)",
+        f"M = +{STRESS_AGENTS} runners",
         f"R = Reset path",
         f"C = Clear walls",
         f"",
@@ -213,14 +265,15 @@ def draw():
         f"Time: {last_time_ms:.4f} ms",
         f"Path length: {len(path)}",
         f"Path cost: {last_cost}",
+        f"Bound: {'-' if last_bound is None else f'{last_bound:.3f}'}",
         f"Computed Blocks: {len(explored)}",
+        f"Runners: {len(agents)}",
         f"Eval file: evaluation_results.json"
     ]
     text_x = sidebar_x + 12
     y0 = sidebar_top + 12
     for line in info_lines:
-        surf = font.render(line, True, TEXT_C)
-        screen.blit(surf, (text_x, y0))
+        screen.blit(text_cache.render(line, TEXT_C), (text_x, y0))
         y0 += 20
 
     draw_table(
@@ -232,37 +285,70 @@ def draw():
         height=HEIGHT,
         text_color=TEXT_C,
         grid_color=GRID_LINE,
+        text_cache=text_cache,
     )
 
     pygame.display.flip()
 
 
 def run_algo(which):
-    global path, explored, last_algo, last_time_ms, last_cost, npc_pos, npc_path_index, npc_tick_accum
+    global path, explored, last_algo, last_time_ms, last_cost, last_bound, ara_search
 
     explored.clear()
-    path.clear()
-    npc_pos = start
-
-    npc_path_index = 0
-    npc_tick_accum = 0.0
+    path = CompactPath.empty()
+    clear_agents()
+    ara_search = None
+    last_bound = None
 
     if which == "BFS":
         p, ex, t = bfs(grid, start, goal)
     elif which == "UCS":
         p, ex, t = ucs(grid, start, goal)
+    elif which == "ARA*":
+        # First slice now; the main loop keeps refining until the bound hits 1.
+        ara_search = AraStar(grid, start, goal)
+        ara_search.run(ARA_DEADLINE_MS)
+        p, ex, t, last_bound = ara_search.path, ara_search.explored, ara_search.time_ms, ara_search.bound
+        if ara_search.done:
+            ara_search = None
     else:
         p, ex, t = astar(grid, start, goal)
 
-    path[:] = p
+    path = CompactPath.from_positions(p, grid)
     explored |= ex
+    agents.spawn(current_path_handle())
     last_algo = which
     last_time_ms = t
+    if recorder:
+        recorder.run(which, t, ARA_DEADLINE_MS if which == "ARA*" else None)
 
-    last_cost = compute_path_cost(grid, path)
+    last_cost = path.cost
     record_evaluation(which)
 
 
+def refine_ara():
+    """Give the running ARA* search one more slice and show any better path."""
+    global path, last_time_ms, last_cost, last_bound, ara_search
+
+    improved = ara_search.run(ARA_DEADLINE_MS)
+    if recorder:
+        recorder.refine(ARA_DEADLINE_MS)
+
+    if improved:
+        path = CompactPath.from_positions(ara_search.path, grid)
+        explored.clear()
+        explored.update(ara_search.explored)
+        clear_agents()
+        agents.spawn(current_path_handle())
+        last_cost = path.cost
+        last_bound = ara_search.bound
+    if improved or ara_search.done:
+        last_time_ms = ara_search.time_ms
+        record_evaluation("ARA*")
+    if ara_search.done:
+        ara_search = None
+
+
 def record_evaluation(which):
     """Store the latest run result to disk and memory for the on-screen table."""
     global evaluation_history
@@ -276,6 +362,10 @@ def record_evaluation(which):
         "explored": len(explored),
         "found": bool(path),
     }
+    if last_bound is not None:
+        # Suboptimality bound of the anytime search (inf = no path in budget).
+        row["bound"] = round(last_bound, 4) if last_bound != float("inf") else None
+        row["deadline_ms"] = ARA_DEADLINE_MS
     existing = {rec.get("algo"): rec for rec in evaluation_history}
     existing[which] = row
     evaluation_history = [existing[m] for m in METHOD_ORDER if m in existing]
@@ -283,19 +373,23 @@ def record_evaluation(which):
 
 
 def handle_mouse(pos, paint_on=None):
-    global grid, start, goal, npc_pos
+    global grid, start, goal, ara_search
     mx, my = pos
     gx = (mx - MARGIN_X) // CELL_SIZE
     gy = (my - MARGIN_Y) // CELL_SIZE
     if not in_bounds(gx, gy):
         return
 
+    # Edits invalidate the state of a search that is still being refined.
+    ara_search = None
+
     cell = (gx, gy)
+    before = grid[gy][gx]
 
     if mode == "start":
         if cell != goal and grid[gy][gx] not in (1, 3):
             start = cell
-            npc_pos = start
+            clear_agents()
 
     elif mode == "goal":
         if cell != start and grid[gy][gx] not in (1, 3):
@@ -316,6 +410,14 @@ def handle_mouse(pos, paint_on=None):
             else:
                 grid[gy][gx] = 2 if paint_on else 0
 
+    if recorder:
+        if grid[gy][gx] != before:
+            recorder.edit(gx, gy, grid[gy][gx])
+        elif mode == "start" and start == cell:
+            recorder.set_start(cell)
+        elif mode == "goal" and goal == cell:
+            recorder.set_goal(cell)
+
 
 
 
@@ -339,13 +441,19 @@ while running:
                 run_algo("UCS")
             elif event.key == pygame.K_3:
                 run_algo("A*")
+            elif event.key == pygame.K_4:
+                run_algo("ARA*")
+
+            elif event.key == pygame.K_m:
+                # Stress test: many runners on the current path, staggered starts.
+                if path:
+                    agents.spawn_many(current_path_handle(), STRESS_AGENTS, spread=len(path))
 
             elif event.key == pygame.K_r:
-                path.clear()
+                path = CompactPath.empty()
                 explored.clear()
-                npc_pos = start
-                npc_path_index = 0
-                npc_tick_accum = 0.0
+                clear_agents()
+                ara_search = None
                 last_cost = 0
 
             elif event.key == pygame.K_c:
@@ -353,16 +461,18 @@ while running:
                     for x in range(GRID_COLS):
                         if grid[y][x] != 3:
                             grid[y][x] = 0
-                path.clear()
+                if recorder:
+                    recorder.clear()
+                path = CompactPath.empty()
                 explored.clear()
-                npc_pos = start
-                npc_path_index = 0
-                npc_tick_accum = 0.0
+                clear_agents()
+                ara_search = None
                 last_cost = 0
 
             # --- Kombinasi dengan CTRL ---
             elif event.key == pygame.K_s and ctrl_down:
                 save_level(grid, start, goal, STAGE_FILES[current_stage])
+                stage_cache.invalidate(STAGE_FILES[current_stage])
                 print(f"Saved {STAGE_FILES[current_stage]}")
 
             elif event.key == pygame.K_l and ctrl_down:
@@ -433,14 +543,12 @@ while running:
                 handle_mouse(event.pos, paint_on=paint_value)
 
 
-    if path:
-        npc_tick_accum += dt
-        step_time = 1.0 / NPC_SPEED
-        while npc_tick_accum >= step_time and npc_path_index < len(path):
-            npc_pos = path[npc_path_index]
-            npc_path_index += 1
-            npc_tick_accum -= step_time
+    if ara_search is not None:
+        refine_ara()
+    agents.update(dt)
 
     draw()
 
+if recorder:
+    recorder.close()
 pygame.quit()
@@ -138,3 +138,128 @@ def astar(grid: Grid, start: Pos, goal: Pos):
     path = reconstruct(came, start, goal)
     t1 = perf_counter()
     return path, explored, (t1 - t0) * 1000
+
+
+class AraStar:
+    """Resumable Anytime Repairing A* (ARA*) search.
+
+    Runs weighted A* with inflation ``w`` starting at ``w0`` and lowers it by
+    ``w_step`` after each solution, reusing earlier search effort. Each
+    ``run(budget_ms)`` call continues where the previous one stopped, so the
+    path keeps improving as long as the caller hands out more time.
+
+    ``bound`` is an upper limit on ``cost(path) / optimal cost`` (``inf``
+    until a first path exists); ``done`` is set once the path is optimal or
+    the goal is unreachable.
+    """
+
+    def __init__(self, grid: Grid, start: Pos, goal: Pos, w0: float = 3.0, w_step: float = 0.5):
+        if w_step <= 0:
+            raise ValueError(f"w_step must be positive, got {w_step}")
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.w = max(w0, 1.0)
+        self.w_step = w_step
+
+        self.path: List[Pos] = []
+        self.bound = float("inf")
+        self.time_ms = 0.0
+        self.done = False
+
+        self._came: Dict[Pos, Pos | None] = {start: None}
+        self._g: Dict[Pos, int] = {start: 0}
+        self.explored: Set[Pos] = {start}
+        self._open: Set[Pos] = {start}
+        self._closed: Set[Pos] = set()
+        self._incons: Set[Pos] = set()
+        # Queue of the iteration in progress; None between iterations.
+        self._pq: List[Tuple[float, Pos]] | None = None
+        self._best_cost = float("inf")
+
+    def _key(self, pos: Pos) -> float:
+        return self._g[pos] + self.w * manhattan(pos, self.goal)
+
+    def run(self, budget_ms: float | None = None) -> bool:
+        """Search for up to ``budget_ms`` (unbounded if None).
+
+        Returns True if a better path or a tighter bound was found.
+        """
+        t0 = perf_counter()
+        deadline = None if budget_ms is None else t0 + budget_ms / 1000
+        improved = False
+        grid, goal, g, came = self.grid, self.goal, self._g, self._came
+        open_set, closed, incons = self._open, self._closed, self._incons
+
+        try:
+            while not self.done:
+                if self._pq is None:
+                    # New iteration: rebuild the queue for the current inflation factor.
+                    self._pq = [(self._key(p), p) for p in open_set]
+                    heapq.heapify(self._pq)
+                pq = self._pq
+
+                while pq and g.get(goal, float("inf")) > pq[0][0]:
+                    if deadline is not None and perf_counter() > deadline:
+                        return improved
+                    k, cur = heapq.heappop(pq)
+                    if cur not in open_set or k != self._key(cur):
+                        continue
+                    open_set.discard(cur)
+                    closed.add(cur)
+
+                    for nb in neighbors(cur, grid):
+                        ng = g[cur] + step_cost(grid, nb)
+                        if nb not in g or ng < g[nb]:
+                            g[nb] = ng
+                            came[nb] = cur
+                            self.explored.add(nb)
+                            if nb in closed:
+                                incons.add(nb)
+                            else:
+                                open_set.add(nb)
+                                heapq.heappush(pq, (self._key(nb), nb))
+
+                self._pq = None
+                if goal not in g:
+                    self.done = True
+                    break
+
+                # Suboptimality bound: g(goal) over the smallest unexpanded f = g + h.
+                frontier = open_set | incons
+                if g[goal] == 0 or not frontier:
+                    bound = 1.0
+                else:
+                    lower = min(g[p] + manhattan(p, goal) for p in frontier)
+                    bound = min(self.w, g[goal] / lower) if lower > 0 else self.w
+                bound = max(bound, 1.0)
+
+                if g[goal] < self._best_cost or bound < self.bound:
+                    self._best_cost, self.bound = g[goal], bound
+                    self.path = reconstruct(came, self.start, goal)
+                    improved = True
+
+                if self.bound <= 1.0:
+                    self.done = True
+                    break
+
+                self.w = max(1.0, self.w - self.w_step)
+                open_set |= incons
+                incons.clear()
+                closed.clear()
+            return improved
+        finally:
+            self.time_ms += (perf_counter() - t0) * 1000
+
+
+def ara_star(grid: Grid, start: Pos, goal: Pos, deadline_ms: float = 5.0, w0: float = 3.0,
+             w_step: float = 0.5):
+    """One-shot ARA*: best result within ``deadline_ms``.
+
+    Returns ``(path, explored, time_ms, bound)``; ``path`` is empty and
+    ``bound`` is ``inf`` when no solution was found before the deadline.
+    Use ``AraStar`` directly to keep improving the result later.
+    """
+    search = AraStar(grid, start, goal, w0, w_step)
+    search.run(deadline_ms)
+    return search.path, search.explored, search.time_ms, search.bound
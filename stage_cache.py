@@ -0,0 +1,182 @@
+"""Immutable, preloaded stage data warmed up on a background thread.
+
+Stage files are parsed and validated once, together with per-grid
+precomputation (connected components), so switching stages in the editor is
+a dictionary lookup instead of a disk read. This module is the only place
+the JSON stage format is read; ``maze_runner.save_level`` writes it.
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from path_finding import Pos, neighbors
+
+TILE_VALUES = (0, 1, 2, 3)
+
+
+@dataclass(frozen=True)
+class StageData:
+    filename: str
+    grid: Tuple[Tuple[int, ...], ...]
+    start: Pos
+    goal: Pos
+    # Component label per cell, -1 for blocked tiles.
+    components: Tuple[Tuple[int, ...], ...]
+
+    def mutable_grid(self):
+        """Fresh nested-list copy for the editor to modify."""
+        return [list(row) for row in self.grid]
+
+    def reachable(self, a: Pos, b: Pos) -> bool:
+        label = self.components[a[1]][a[0]]
+        return label >= 0 and label == self.components[b[1]][b[0]]
+
+
+def _label_components(grid) -> Tuple[Tuple[int, ...], ...]:
+    rows, cols = len(grid), len(grid[0])
+    labels = [[-1] * cols for _ in range(rows)]
+    label = 0
+    for y in range(rows):
+        for x in range(cols):
+            if labels[y][x] != -1 or grid[y][x] in (1, 3):
+                continue
+            labels[y][x] = label
+            q = deque([(x, y)])
+            while q:
+                for nx, ny in neighbors(q.popleft(), grid):
+                    if labels[ny][nx] == -1:
+                        labels[ny][nx] = label
+                        q.append((nx, ny))
+            label += 1
+    return tuple(tuple(row) for row in labels)
+
+
+def load_stage_data(filename: str) -> StageData:
+    """Parse, validate and precompute one stage file.
+
+    Raises FileNotFoundError for missing files and ValueError for malformed ones.
+    """
+    with open(filename, "r") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{filename}: expected a JSON object")
+
+    try:
+        cols, rows = data["cols"], data["rows"]
+        raw_grid = data["grid"]
+        start = tuple(data["start"])
+        goal = tuple(data["goal"])
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"{filename}: missing field {exc}") from None
+
+    if not all(isinstance(v, int) for v in (cols, rows, *start, *goal)):
+        raise ValueError(f"{filename}: cols, rows, start and goal must be integers")
+    if len(start) != 2 or len(goal) != 2:
+        raise ValueError(f"{filename}: start and goal must be [x, y]")
+    if cols <= 0 or rows <= 0:
+        raise ValueError(f"{filename}: empty grid")
+    if (
+        not isinstance(raw_grid, list)
+        or len(raw_grid) != rows
+        or any(not isinstance(row, list) or len(row) != cols for row in raw_grid)
+    ):
+        raise ValueError(f"{filename}: grid is not {cols}x{rows}")
+    if any(val not in TILE_VALUES for row in raw_grid for val in row):
+        raise ValueError(f"{filename}: unknown tile value")
+    for name, (x, y) in (("start", start), ("goal", goal)):
+        if not (0 <= x < cols and 0 <= y < rows):
+            raise ValueError(f"{filename}: {name} {(x, y)} out of bounds")
+
+    grid = tuple(tuple(row) for row in raw_grid)
+    return StageData(
+        filename=filename,
+        grid=grid,
+        start=start,
+        goal=goal,
+        components=_label_components(grid),
+    )
+
+
+class StageCache:
+    """Thread-safe filename -> StageData cache.
+
+    ``warm()`` loads stages on a daemon thread; ``get()`` waits for a
+    pending load or loads synchronously if none was scheduled. Entries stay
+    valid until ``invalidate()`` is called after the file is rewritten.
+    """
+
+    def __init__(self, filenames: Iterable[str]):
+        self.filenames = list(filenames)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Optional[StageData]] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._ready: Dict[str, threading.Event] = {}
+        # Bumped on invalidate so a stale in-flight load is discarded.
+        self._generation: Dict[str, int] = {}
+
+    def _load(self, filename: str, generation: int, event: threading.Event) -> None:
+        try:
+            try:
+                entry, error = load_stage_data(filename), None
+            except Exception as exc:
+                # Any failure is reported through error(); it must never kill
+                # the warm-up thread and leave get() waiting forever.
+                entry, error = None, exc
+            with self._lock:
+                if self._generation.get(filename, 0) == generation:
+                    self._entries[filename] = entry
+                    if error is None:
+                        self._errors.pop(filename, None)
+                    else:
+                        self._errors[filename] = error
+        finally:
+            # A stale load still wakes its waiters; get() then waits on the newer event.
+            event.set()
+
+    def _schedule(self, filenames: Iterable[str]):
+        jobs = []
+        with self._lock:
+            for name in filenames:
+                event = threading.Event()
+                self._ready[name] = event
+                jobs.append((name, self._generation.get(name, 0), event))
+        return jobs
+
+    def warm(self, filenames: Optional[Iterable[str]] = None) -> threading.Thread:
+        jobs = self._schedule(self.filenames if filenames is None else filenames)
+
+        def worker():
+            for job in jobs:
+                self._load(*job)
+
+        thread = threading.Thread(target=worker, name="stage-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def get(self, filename: str) -> Optional[StageData]:
+        """Cached stage, or None if the file is missing or invalid (see ``error``)."""
+        while True:
+            with self._lock:
+                event = self._ready.get(filename)
+            if event is None:
+                for job in self._schedule([filename]):
+                    self._load(*job)
+                continue
+            event.wait()
+            with self._lock:
+                if self._ready.get(filename) is event:
+                    return self._entries.get(filename)
+
+    def error(self, filename: str) -> Optional[Exception]:
+        with self._lock:
+            return self._errors.get(filename)
+
+    def invalidate(self, filename: str) -> None:
+        """Drop a stage after it was saved and reload it in the background."""
+        with self._lock:
+            self._generation[filename] = self._generation.get(filename, 0) + 1
+            self._entries.pop(filename, None)
+        self.warm([filename])
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from typing import Tuple
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces for one font.
+
+    Sidebar lines and table cells only change after a search, a mode switch
+    or a stage change, so most frames can reuse the surfaces from before.
+    """
+
+    def __init__(self, font, max_entries: int = 256):
+        self.font = font
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[Tuple[str, Color], object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, color: Color):
+        key = (text, tuple(color))
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self.font.render(text, True, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -0,0 +1,201 @@
+"""Record editor sessions to a trace file and replay them headlessly.
+
+A trace is JSON lines, one operation per line, ``[op, t, *args]`` where ``t``
+is seconds since recording started:
+
+    ["load", t, stage, grid, start, goal]
+    ["edit", t, x, y, value]
+    ["start", t, x, y]
+    ["goal", t, x, y]
+    ["clear", t]
+    ["run", t, algo, time_ms]
+    ["run", t, algo, time_ms, deadline_ms]   (ARA* only)
+    ["refine", t, deadline_ms]               (one more slice for the last ARA* run)
+
+Replay re-executes the trace against path_finding (no pygame needed):
+
+    python workload.py session.jsonl --repeat 5
+    python workload.py session.jsonl --per-op      # one line per operation
+    python workload.py session.jsonl --json        # raw timing records
+"""
+
+import argparse
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from path_finding import AraStar, ara_star, astar, bfs, ucs
+
+ALGORITHMS = {"BFS": bfs, "UCS": ucs, "A*": astar, "ARA*": ara_star}
+
+
+class WorkloadRecorder:
+    """Append-only writer for editor operations."""
+
+    def __init__(self, filename):
+        self.path = Path(filename)
+        self._f = self.path.open("w", encoding="utf-8")
+        self._t0 = perf_counter()
+
+    def _write(self, op: str, *args: Any) -> None:
+        t = round(perf_counter() - self._t0, 4)
+        self._f.write(json.dumps([op, t, *args], separators=(",", ":")) + "\n")
+        # Flush every op so a crash mid-session still leaves a usable trace.
+        self._f.flush()
+
+    def load(self, stage: int, grid, start, goal) -> None:
+        self._write("load", stage, grid, list(start), list(goal))
+
+    def edit(self, x: int, y: int, value: int) -> None:
+        self._write("edit", x, y, value)
+
+    def set_start(self, pos) -> None:
+        self._write("start", *pos)
+
+    def set_goal(self, pos) -> None:
+        self._write("goal", *pos)
+
+    def clear(self) -> None:
+        self._write("clear")
+
+    def run(self, algo: str, time_ms: float, deadline_ms: Optional[float] = None) -> None:
+        if deadline_ms is None:
+            self._write("run", algo, round(time_ms, 4))
+        else:
+            self._write("run", algo, round(time_ms, 4), deadline_ms)
+
+    def refine(self, deadline_ms: float) -> None:
+        self._write("refine", deadline_ms)
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+            print(f"Trace disimpan: {self.path}")
+
+
+def read_trace(filename) -> List[list]:
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def replay(ops: List[list]) -> List[Dict[str, Any]]:
+    """Re-execute a trace and return one timing record per operation."""
+    grid: List[List[int]] = []
+    start = goal = (0, 0)
+    ara: Optional[AraStar] = None  # search that "refine" ops continue
+    timings: List[Dict[str, Any]] = []
+
+    for op, _, *args in ops:
+        t0 = perf_counter()
+        rec: Dict[str, Any] = {"op": op}
+        if op not in ("run", "refine"):
+            ara = None
+
+        if op == "load":
+            _, g, s, e = args
+            grid = [list(row) for row in g]
+            start, goal = tuple(s), tuple(e)
+        elif op == "edit":
+            x, y, value = args
+            grid[y][x] = value
+        elif op == "start":
+            start = tuple(args)
+        elif op == "goal":
+            goal = tuple(args)
+        elif op == "clear":
+            for row in grid:
+                for x, val in enumerate(row):
+                    if val != 3:
+                        row[x] = 0
+        elif op == "run":
+            algo, recorded_ms, *extra = args
+            ara = None
+            if algo == "ARA*":
+                ara = AraStar(grid, start, goal)
+                # Traces older than the deadline field ran with ara_star's default 5 ms.
+                ara.run(extra[0] if extra else 5.0)
+                result = (ara.path, ara.explored, ara.time_ms)
+            else:
+                result = ALGORITHMS[algo](grid, start, goal)
+            rec.update(algo=algo, recorded_ms=recorded_ms, search_ms=result[2],
+                       path_length=len(result[0]), explored=len(result[1]))
+        elif op == "refine":
+            (deadline_ms,) = args
+            if ara is not None:
+                ara.run(deadline_ms)
+                rec.update(path_length=len(ara.path), bound=ara.bound)
+        else:
+            raise ValueError(f"Unknown trace op: {op!r}")
+
+        rec["ms"] = (perf_counter() - t0) * 1000
+        timings.append(rec)
+    return timings
+
+
+def summarize(timings: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Count, total, mean and max milliseconds per op (runs split by algo).
+
+    Run rows also carry ``recorded_mean_ms`` (search time logged in the
+    editor) and ``replayed_mean_ms`` (search time measured on replay).
+    """
+    summary: Dict[str, Dict[str, float]] = {}
+    for rec in timings:
+        name = f"run:{rec['algo']}" if rec["op"] == "run" else rec["op"]
+        s = summary.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        s["count"] += 1
+        s["total_ms"] += rec["ms"]
+        s["max_ms"] = max(s["max_ms"], rec["ms"])
+        if rec["op"] == "run":
+            s["recorded_ms"] = s.get("recorded_ms", 0.0) + rec["recorded_ms"]
+            s["replayed_ms"] = s.get("replayed_ms", 0.0) + rec["search_ms"]
+    for s in summary.values():
+        s["mean_ms"] = s["total_ms"] / s["count"]
+        if "recorded_ms" in s:
+            s["recorded_mean_ms"] = s.pop("recorded_ms") / s["count"]
+            s["replayed_mean_ms"] = s.pop("replayed_ms") / s["count"]
+    return summary
+
+
+def _fmt(value: Any, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a Maze Runner workload trace.")
+    parser.add_argument("trace")
+    parser.add_argument("--repeat", type=int, default=1, help="replay the trace N times")
+    parser.add_argument("--per-op", action="store_true", help="also list every operation")
+    parser.add_argument("--json", action="store_true", help="print the timing records as JSON")
+    args = parser.parse_args(argv)
+
+    ops = read_trace(args.trace)
+    timings: List[Dict[str, Any]] = []
+    for _ in range(args.repeat):
+        timings.extend(replay(ops))
+
+    if args.json:
+        print(json.dumps(timings, indent=2))
+        return
+
+    if args.per_op:
+        print(f"{'#':>5}  {'op':<12}{'ms':>10}{'rec ms':>10}{'replay ms':>11}{'len':>6}{'nodes':>7}")
+        for i, rec in enumerate(timings):
+            name = f"run:{rec['algo']}" if rec["op"] == "run" else rec["op"]
+            print(
+                f"{i:>5}  {name:<12}{rec['ms']:>10.4f}"
+                f"{_fmt(rec.get('recorded_ms'), '.4f'):>10}{_fmt(rec.get('search_ms'), '.4f'):>11}"
+                f"{_fmt(rec.get('path_length'), 'd'):>6}{_fmt(rec.get('explored'), 'd'):>7}"
+            )
+        print()
+
+    print(f"{'op':<12}{'count':>7}{'total ms':>12}{'mean ms':>10}{'max ms':>10}{'rec mean':>10}{'replay mean':>13}")
+    for name, s in sorted(summarize(timings).items()):
+        print(
+            f"{name:<12}{s['count']:>7}{s['total_ms']:>12.3f}{s['mean_ms']:>10.4f}{s['max_ms']:>10.4f}"
+            f"{_fmt(s.get('recorded_mean_ms'), '.4f'):>10}{_fmt(s.get('replayed_mean_ms'), '.4f'):>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()